@@ -7,34 +7,102 @@ Usage:
 """
 
 import argparse
+import os
 import re
-import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone, date
-from typing import Any
+from zoneinfo import ZoneInfo
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup, Tag
-from dateutil import tz, parser as dateparser
+import requests_cache
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag, UnicodeDammit
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 DEFAULT_URL = "https://2025.djangocon.us/schedule/"
-TZ_LOCAL = tz.gettz("America/Chicago")  # conference timezone
+SITE_URL = "https://2025.djangocon.us"
+TZ_LOCAL = ZoneInfo("America/Chicago")  # conference timezone
 CONFERENCE_YEAR = 2025
 LINE_FOLD_LIMIT = 75
+MAX_CONCURRENT_FETCHES = 8  # talk pages in flight at once; also the connection pool size
+ICS_WRITE_BUFFER = 64 * 1024
+SCHEDULE_CACHE_TTL = 60 * 60  # seconds; the schedule page still changes during the conference
+TALK_CACHE_TTL = 24 * 60 * 60  # talk abstracts rarely change once published
 
 DAY_H2_RE = re.compile(
     r"^\s*(Talks: .*?|Sprints: .*?)\s*/\s*(.+)$"
 )  # captures label and "Monday, Sep 8"
+DAY_DATE_FORMAT = "%A, %b %d, %Y"  # "Monday, Sep 8, 2025"
 
+# Only build tree nodes for tags the parse_* functions read; skips the page chrome
+SCHEDULE_STRAINER = SoupStrainer(
+    ["h2", "div", "section", "h3", "h4", "h6", "time", "a", "p", "span"]
+)
 
-def main() -> None:
-    """CLI entry point for DjangoCon calendar scraper."""
+# Compiled once at import so the parse_* functions don't rebuild matchers per day/slot/event
+TIME_BLOCK_SELECTOR = sv.compile('div[class="flex flex-wrap gap-4 lg:gap-8"]')
+ROOM_SELECTOR = sv.compile("p.text-sm")
+PRESENTERS_SELECTOR = sv.compile('div[class="pt-6 mt-auto"]')
+AUDIENCE_SELECTOR = sv.compile(
+    'span[class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded"]'
+)
+
+# Talk pages are parsed once each and only read here, so skip building a BeautifulSoup tree
+TALK_DESCRIPTION_XPATH = etree.XPath(
+    '(//h2[normalize-space()="About this session"])[1]'
+    '/following::div[contains(concat(" ", normalize-space(@class), " "), " prose ")][1]//p'
+)
+
+
+def _pooled(session: requests.Session) -> requests.Session:
+    """Size the connection pool so every concurrent talk fetch gets a keep-alive connection."""
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_FETCHES))
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_FETCHES))
+    return session
+
+
+# Shared session so the schedule page and every talk page reuse pooled keep-alive connections.
+# Used when no session is passed in; CLI runs pass their own disk-cached one
+_session = _pooled(requests.Session())
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    """A single schedule entry, ready for ICS export."""
+
+    title: str
+    start: datetime
+    end: datetime
+    # Optional details; breaks and other sections without a room or talk page leave them empty
+    room: str = ""
+    description: str = ""
+    url: str = ""
+    talk_description: str = ""
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for DjangoCon calendar scraper.
+
+    Args:
+        argv: Command-line arguments; defaults to sys.argv[1:]
+    """
     ap = argparse.ArgumentParser()
     ap.add_argument("--url", default=DEFAULT_URL)
     ap.add_argument("--out", default="djangocon-2025.ics")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="bypass the HTTP cache and refetch every page")
+    args = ap.parse_args(argv)
 
     try:
-        events = scrape_schedule(args.url)
+        # Closing the session also closes its SQLite connection
+        with cached_session() as session:
+            with session.cache_disabled() if args.no_cache else nullcontext():
+                events = scrape_schedule(args.url, session)
         generate_ics(events, args.out)
         print(f"Wrote {len(events)} events to {args.out}")
     except Exception as e:
@@ -43,26 +111,67 @@ def main() -> None:
     return 0
 
 
-def scrape_schedule(url: str) -> list[dict[str, Any]]:
-    """Fetch and parse DjangoCon schedule HTML into structured events."""
+def cached_session() -> requests_cache.CachedSession:
+    """Build the HTTP-cached session used by CLI runs.
+    
+    Created on demand rather than at import, since opening the SQLite cache in the user cache dir
+    writes to disk. Reruns then skip unchanged pages entirely.
+    """
+    return _pooled(
+        requests_cache.CachedSession(
+            "djangocon-cal",
+            use_cache_dir=True,
+            expire_after=SCHEDULE_CACHE_TTL,
+            urls_expire_after={"2025.djangocon.us/talks/*": TALK_CACHE_TTL},
+        )
+    )
+
+
+def scrape_schedule(url: str, session: requests.Session | None = None) -> list[Event]:
+    """Fetch and parse DjangoCon schedule HTML into structured events.
+    
+    Args:
+        url: The schedule page
+        session: Session for the schedule and talk pages; defaults to the shared one
+    """
     try:
-        html = requests.get(url, timeout=30).text
+        response = (session or _session).get(url, timeout=30)
     except requests.RequestException as e:
         raise Exception(f"Failed to fetch schedule from {url}: {e}")
     
-    soup = BeautifulSoup(html, "html.parser")
+    # Hand lxml the raw bytes; it decodes them itself, skipping an extra str copy
+    soup = BeautifulSoup(
+        response.content,
+        "lxml",
+        from_encoding=header_encoding(response),
+        parse_only=SCHEDULE_STRAINER,
+    )
     events = []
 
-    # Process each day section
+    # Process each day section; talk pages are left for the concurrent fetch below
     for h2 in soup.find_all("h2"):
-        day_events = parse_day_events(h2)
+        day_events = parse_day_events(h2, talk_descriptions={})
         events.extend(day_events)
-    
-    return events
+
+    # Only talks that became events are fetched, concurrently since each is a round-trip
+    talk_descriptions = fetch_talk_descriptions(
+        (event.url for event in events if event.url), session
+    )
+    return [
+        with_talk_description(event, talk_descriptions[event.url]) if event.url else event
+        for event in events
+    ]
 
 
-def parse_day_events(h2: Tag) -> list[dict[str, Any]]:
-    """Extract all events from a day's schedule section."""
+def parse_day_events(
+    h2: Tag, talk_descriptions: dict[str, str] | None = None
+) -> list[Event]:
+    """Extract all events from a day's schedule section.
+    
+    Args:
+        h2: The day header, e.g. "Talks: Day 1 / Monday, Sep 8"
+        talk_descriptions: Prefetched talk descriptions keyed by talk URL
+    """
     events = []
     
     # Skip non-day headers
@@ -86,16 +195,16 @@ def parse_day_events(h2: Tag) -> list[dict[str, Any]]:
         return events
 
     # Process each time slot in the day
-    for time_block in day_container.find_all(
-        "div", class_="flex flex-wrap gap-4 lg:gap-8"
-    ):
-        time_events = parse_time_block_events(time_block)
+    for time_block in TIME_BLOCK_SELECTOR.select(day_container):
+        time_events = parse_time_block_events(time_block, talk_descriptions)
         events.extend(time_events)
     
     return events
 
 
-def parse_time_block_events(time_block: Tag) -> list[dict[str, Any]]:
+def parse_time_block_events(
+    time_block: Tag, talk_descriptions: dict[str, str] | None = None
+) -> list[Event]:
     """Extract events from a specific time slot."""
     events = []
     
@@ -116,8 +225,8 @@ def parse_time_block_events(time_block: Tag) -> list[dict[str, Any]]:
 
     # Convert ISO datetime strings to datetime objects
     try:
-        start_dt = dateparser.parse(start_time_str)
-        end_dt = dateparser.parse(end_time_str)
+        start_dt = parse_iso_datetime(start_time_str)
+        end_dt = parse_iso_datetime(end_time_str)
     except (ValueError, TypeError) as e:
         print(f"Warning: Failed to parse datetime '{start_time_str}' or '{end_time_str}': {e}")
         return events
@@ -125,44 +234,69 @@ def parse_time_block_events(time_block: Tag) -> list[dict[str, Any]]:
     # Process each event in this time slot
     event_sections = time_block.find_all("section")
     for section in event_sections:
-        event = parse_section_event(section, start_dt, end_dt)
+        event = parse_section_event(section, start_dt, end_dt, talk_descriptions)
         if event:
             events.append(event)
     
     return events
 
 
-def fetch_talk_description(talk_url: str) -> str:
+def fetch_talk_description(talk_url: str, session: requests.Session | None = None) -> str:
     """Fetch talk description from individual talk page."""
     if not talk_url:
         return ""
     
     try:
-        response = requests.get(talk_url, timeout=10)
+        response = (session or _session).get(talk_url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Look for the "About this session" section
-        about_section = soup.find("h2", string="About this session")
-        if about_section:
-            # Find the next div with prose class that contains the description
-            prose_div = about_section.find_next("div", class_="prose")
-            if prose_div:
-                # Extract text from paragraphs, preserving line breaks
-                paragraphs = prose_div.find_all("p")
-                if paragraphs:
-                    return "\n\n".join(clean_text(p.get_text(" ")) for p in paragraphs)
+        if not response.content.strip():
+            return ""
+        # libxml2 assumes Latin-1 for undeclared bytes, so fall back to sniffing meta/UTF-8 like bs4
+        encoding = (
+            header_encoding(response)
+            or UnicodeDammit(response.content, is_html=True).original_encoding
+        )
+        doc = lxml.html.document_fromstring(
+            response.content, parser=lxml.html.HTMLParser(encoding=encoding)
+        )
         
-        return ""
+        # Paragraphs of the first div.prose after the "About this session" heading
+        paragraphs = TALK_DESCRIPTION_XPATH(doc)
+        # Preserve paragraph breaks
+        return "\n\n".join(clean_text(" ".join(p.itertext())) for p in paragraphs)
     except (requests.RequestException, Exception) as e:
         print(f"Warning: Failed to fetch description from {talk_url}: {e}")
         return ""
 
 
-def parse_section_event(section: Tag, start_dt: datetime, end_dt: datetime) -> dict[str, Any] | None:
-    """Extract event details from a schedule section."""
+def fetch_talk_descriptions(
+    talk_urls: Iterable[str], session: requests.Session | None = None
+) -> dict[str, str]:
+    """Fetch talk descriptions concurrently, keyed by talk URL."""
+    unique_urls = list(dict.fromkeys(talk_urls))
+    # Threads rather than asyncio: the work is blocking requests calls on one shared session
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as pool:
+        descriptions = pool.map(fetch_talk_description, unique_urls, repeat(session))
+        return dict(zip(unique_urls, descriptions))
+
+
+def parse_section_event(
+    section: Tag,
+    start_dt: datetime,
+    end_dt: datetime,
+    talk_descriptions: dict[str, str] | None = None,
+) -> Event | None:
+    """Extract event details from a schedule section.
+    
+    Args:
+        section: The event's <section> element
+        start_dt: Start of the enclosing time slot
+        end_dt: End of the enclosing time slot
+        talk_descriptions: Prefetched talk descriptions keyed by talk URL; talks
+            missing from it get none. When omitted, each talk page is fetched here
+    """
     # Get room information
-    room_p = section.find("p", class_="text-sm")
+    room_p = ROOM_SELECTOR.select_one(section)
     room = clean_text(room_p.get_text(" ")) if room_p else ""
 
     # Get event title
@@ -173,10 +307,7 @@ def parse_section_event(section: Tag, start_dt: datetime, end_dt: datetime) -> d
     title_link = h4.find("a")
     if title_link:
         title = clean_text(title_link.get_text(" "))
-        talk_url = title_link.get("href", "")
-        # Convert relative URL to absolute URL
-        if talk_url and not talk_url.startswith("http"):
-            talk_url = f"https://2025.djangocon.us{talk_url}"
+        talk_url = absolute_url(title_link.get("href", ""))
     else:
         title = clean_text(h4.get_text(" "))
         talk_url = ""
@@ -185,19 +316,15 @@ def parse_section_event(section: Tag, start_dt: datetime, end_dt: datetime) -> d
         return None
 
     # Get presenter names
-    presenter_section = section.find("div", class_="pt-6 mt-auto")
+    presenter_section = PRESENTERS_SELECTOR.select_one(section)
     presenters = []
     if presenter_section:
-        presenter_names = presenter_section.find_all("h6")
         presenters = [
-            clean_text(name.get_text(" ")) for name in presenter_names
+            clean_text(name.get_text(" ")) for name in presenter_section.find_all("h6")
         ]
 
     # Get audience level (skip "All" as it's redundant)
-    audience_span = section.find(
-        "span",
-        class_="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded",
-    )
+    audience_span = AUDIENCE_SELECTOR.select_one(section)
     audience_level = ""
     if audience_span:
         audience_text = clean_text(audience_span.get_text(" "))
@@ -207,83 +334,117 @@ def parse_section_event(section: Tag, start_dt: datetime, end_dt: datetime) -> d
     # Fetch talk description if URL is available
     talk_description = ""
     if talk_url:
-        talk_description = fetch_talk_description(talk_url)
-
-    # Combine metadata into description
-    desc_parts = []
-    if presenters:
-        desc_parts.append("Presented by: " + ", ".join(presenters))
-    if audience_level:
-        desc_parts.append(audience_level)
-    if room:
-        desc_parts.append(f"Location: {room}")
-    if talk_description:
-        desc_parts.append(f"\nDescription:\n{talk_description}")
-    if talk_url:
-        desc_parts.append(f"\nMore info: {talk_url}")
-
-    description = "\n".join(desc_parts) if desc_parts else ""
-
-    return {
-        "title": title,
-        "start": start_dt,
-        "end": end_dt,
-        "room": room,
-        "description": description,
-        "url": talk_url,
-        "talk_description": talk_description,
-    }
+        if talk_descriptions is not None:
+            talk_description = talk_descriptions.get(talk_url, "")
+        else:
+            talk_description = fetch_talk_description(talk_url)
+
+    # Combine metadata into description; absent parts are None and dropped by filter()
+    description = "\n".join(filter(None, (
+        f"Presented by: {', '.join(presenters)}" if presenters else None,
+        audience_level or None,
+        f"Location: {room}" if room else None,
+        f"\nMore info: {talk_url}" if talk_url else None,
+    )))
+
+    event = Event(
+        title=title,
+        start=start_dt,
+        end=end_dt,
+        room=room,
+        description=description,
+        url=talk_url,
+    )
+    return with_talk_description(event, talk_description)
+
+
+def with_talk_description(event: Event, talk_description: str) -> Event:
+    """Return the event with its talk page's description added."""
+    if not talk_description:
+        return event
+    # The abstract goes just above the closing "More info" line that every talk event ends with
+    more_info = f"\nMore info: {event.url}"
+    metadata = event.description.removesuffix(more_info)
+    return replace(
+        event,
+        description=f"{metadata}\nDescription:\n{talk_description}\n{more_info}",
+        talk_description=talk_description,
+    )
 
 
-def generate_ics(events: list[dict[str, Any]], output_file: str) -> None:
+def generate_ics(events: list[Event], output_file: str) -> None:
     """Create iCalendar file from parsed events."""
-    # Create ICS with UTC times for portability
-    lines = [
-        "BEGIN:VCALENDAR",
-        "PRODID:-//Custom//DjangoCon US 2025 Export//EN",
-        "VERSION:2.0",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
-    dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-    for ev in events:
-        uid = f"{uuid.uuid4()}@djangocon-2025"
-        summary = ics_escape(ev["title"])
-        dtstart = to_utc_z(ev["start"])
-        dtend = to_utc_z(ev["end"])
-        description = (
-            ics_escape(ev.get("description", "")) if ev.get("description") else ""
+    dtstamp = to_utc_z(datetime.now(timezone.utc))
+
+    # newline="" keeps RFC 5545 CRLFs intact
+    with open(output_file, "w", encoding="utf-8", newline="", buffering=ICS_WRITE_BUFFER) as f:
+        write = f.write
+        # Create ICS with UTC times for portability
+        write(
+            "BEGIN:VCALENDAR\r\n"
+            "PRODID:-//Custom//DjangoCon US 2025 Export//EN\r\n"
+            "VERSION:2.0\r\n"
+            "CALSCALE:GREGORIAN\r\n"
+            "METHOD:PUBLISH\r\n"
         )
-        location = ics_escape(ev["room"]) if ev.get("room") else ""
-        url = ev.get("url", "")
-        lines.extend(
-            [
+
+        # One urandom call for every UID instead of a uuid4() object per event
+        uid_hex = os.urandom(16 * len(events)).hex()
+        for i, ev in enumerate(events):
+            uid = format_uid(uid_hex[32 * i : 32 * (i + 1)])
+            summary = ics_escape(ev.title)
+            dtstart = to_utc_z(ev.start)
+            dtend = to_utc_z(ev.end)
+            description = ics_escape(ev.description) if ev.description else ""
+            location = ics_escape(ev.room) if ev.room else ""
+            url = ev.url
+            # One write per event; empty optional lines are filtered out
+            write("\r\n".join(filter(None, (
                 "BEGIN:VEVENT",
                 f"UID:{uid}",
                 f"DTSTAMP:{dtstamp}",
                 f"DTSTART:{dtstart}",
                 f"DTEND:{dtend}",
-                fold_line(f"SUMMARY:{summary}"),
-            ]
-        )
-        if location:
-            lines.append(fold_line(f"LOCATION:{location}"))
-        if description:
-            lines.append(fold_line(f"DESCRIPTION:{description}"))
-        if url:
-            lines.append(fold_line(f"URL:{url}"))
-        lines.append("END:VEVENT")
+                maybe_fold(f"SUMMARY:{summary}"),
+                location and maybe_fold(f"LOCATION:{location}"),
+                description and maybe_fold(f"DESCRIPTION:{description}"),
+                url and maybe_fold(f"URL:{url}"),
+                "END:VEVENT",
+            ))) + "\r\n")
 
-    lines.append("END:VCALENDAR")
+        write("END:VCALENDAR")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\r\n".join(lines))
+
+def header_encoding(response: requests.Response) -> str | None:
+    """Return the charset the Content-Type header declares, if any."""
+    # requests assumes ISO-8859-1 for any text/* type without one, so only trust an explicit charset
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    return None
+
+
+def absolute_url(href: str) -> str:
+    """Resolve a site-relative schedule link to an absolute URL."""
+    if href and not href.startswith("http"):
+        return f"{SITE_URL}{href}"
+    return href
+
+
+def format_uid(hex32: str) -> str:
+    """Format 32 random hex digits as a UUID-style iCalendar UID."""
+    return f"{hex32[:8]}-{hex32[8:12]}-{hex32[12:16]}-{hex32[16:20]}-{hex32[20:]}@djangocon-2025"
 
 
 def clean_text(s: str | None) -> str:
     """Normalize whitespace in extracted text."""
-    return re.sub(r"\s+", " ", s or "").strip()
+    if not s:
+        return ""
+    s = s.strip()
+    # get_text(" ") output is usually already single-spaced
+    if "  " not in s and s.isprintable():
+        return s
+    # split() with no separator breaks on the same Unicode whitespace runs as \s+, in C
+    return " ".join(s.split())
 
 
 def parse_day_date(label_text: str) -> tuple[str | None, date | None]:
@@ -300,21 +461,44 @@ def parse_day_date(label_text: str) -> tuple[str | None, date | None]:
         return None, None
     day_text = m.group(2)  # "Monday, Sep 8"
     # Add year since schedule only shows month/day
+    day_text_with_year = f"{day_text}, {CONFERENCE_YEAR}"
     try:
-        dt = dateparser.parse(f"{day_text}, {CONFERENCE_YEAR}", fuzzy=True).date()
+        dt = datetime.strptime(day_text_with_year, DAY_DATE_FORMAT).date()
+        return m.group(1).strip(), dt
+    except ValueError:
+        pass  # not the usual header format; let dateutil's fuzzy parser try
+    # dateutil is only imported on this fallback path; its regex-heavy parser is slow to import
+    from dateutil import parser as dateparser
+
+    try:
+        dt = dateparser.parse(day_text_with_year, fuzzy=True).date()
         return m.group(1).strip(), dt
     except (ValueError, TypeError) as e:
         print(f"Warning: Failed to parse date '{day_text}': {e}")
         return None, None
 
 
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp from a <time datetime="..."> attribute."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # fromisoformat is C-fast but strict; dateutil still handles the odd format
+        from dateutil import parser as dateparser
+
+        return dateparser.parse(value)
+
+
 def to_utc_z(dt_local: datetime) -> str:
     """Format datetime as UTC for iCalendar."""
-    return dt_local.astimezone(tz.UTC).strftime("%Y%m%dT%H%M%SZ")
+    # Builtin timezone.utc and int formatting skip dateutil's tzinfo and strftime's format parser
+    u = dt_local.astimezone(timezone.utc)
+    return f"{u.year:04d}{u.month:02d}{u.day:02d}T{u.hour:02d}{u.minute:02d}{u.second:02d}Z"
 
 
 def ics_escape(text: str) -> str:
     """Escape special characters for iCalendar."""
+    # Backslash must go first so the escapes added below aren't doubled
     return (
         text.replace("\\", "\\\\")
         .replace(",", "\\,")
@@ -323,17 +507,37 @@ def ics_escape(text: str) -> str:
     )
 
 
+def maybe_fold(line: str) -> str:
+    """Fold a content line only if it can exceed the octet limit."""
+    # Most lines are short ASCII, where chars == octets, so skip fold_line entirely
+    if len(line) <= LINE_FOLD_LIMIT and line.isascii():
+        return line
+    return fold_line(line)
+
+
 def fold_line(s: str, limit: int = LINE_FOLD_LIMIT) -> str:
     """Fold long lines per iCalendar spec."""
-    out = []
-    while len(s.encode("utf-8")) > limit:
-        cut = limit
-        while cut > 0 and (len(s[:cut].encode("utf-8")) > limit):
+    # Continuation lines start with a space, so they carry one octet less of content
+    if s.isascii():
+        # One byte per char, so octet limits can be applied to the str directly without encoding
+        if len(s) <= limit:
+            return s
+        parts = [s[:limit]]
+        parts.extend(s[i : i + limit - 1] for i in range(limit, len(s), limit - 1))
+        return "\r\n ".join(parts)
+
+    b = s.encode("utf-8")
+    parts = []
+    start, width = 0, limit
+    while len(b) - start > width:
+        cut = start + width
+        # Back up off UTF-8 continuation bytes so a multi-byte char is never split
+        while cut > start and (b[cut] & 0xC0) == 0x80:
             cut -= 1
-        out.append(s[:cut])
-        s = " " + s[cut:]
-    out.append(s)
-    return "\r\n".join(out)
+        parts.append(b[start:cut])
+        start, width = cut, limit - 1
+    parts.append(b[start:])
+    return b"\r\n ".join(parts).decode("utf-8")
 
 
 if __name__ == "__main__":
@@ -3,20 +3,29 @@
 Tests for DjangoCon schedule scraper.
 """
 
+import functools
 from datetime import date, datetime
 from unittest.mock import patch
 
 import pytest
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+import requests_mock
+from bs4 import BeautifulSoup, Tag
 from dateutil import tz
 
+import main as main_module
+
 # Import the functions we want to test
 from main import (
+    absolute_url,
     clean_text,
     fold_line,
+    format_uid,
     ics_escape,
+    maybe_fold,
     parse_day_date,
+    parse_iso_datetime,
     to_utc_z,
     scrape_schedule,
     generate_ics,
@@ -25,15 +34,241 @@ from main import (
     parse_time_block_events,
     parse_section_event,
     fetch_talk_description,
+    fetch_talk_descriptions,
+    Event,
+)
+
+
+# Built once at import; the tests only attach it to datetimes
+CHICAGO_TZ = tz.gettz("America/Chicago")
+
+
+# Schedule pages shared by the integration tests, composed from one copy of each day's block
+MOCK_DAY1_BLOCK = """
+    <div class="relative">
+        <h2>
+            <a href="#Day-1">
+                <span class="font-medium">Talks: Day 1</span> /
+                <time datetime="2025-09-08">Monday, Sep 8</time>
+            </a>
+        </h2>
+        <div class="flex flex-wrap gap-4 lg:gap-8">
+            <div class="w-full md:w-48">
+                <h3>
+                    <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
+                    <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
+                </h3>
+            </div>
+            <ul>
+                <li>
+                    <section>
+                        <header>
+                            <div>
+                                <p class="text-sm">Main Ballroom</p>
+                            </div>
+                        </header>
+                        <h4>
+                            <a href="/talks/opening-keynote/">Opening Keynote</a>
+                        </h4>
+                        <div class="pt-6 mt-auto">
+                            <ul>
+                                <li>
+                                    <h6>John Doe</h6>
+                                </li>
+                            </ul>
+                        </div>
+                        <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">Beginner</span>
+                    </section>
+                </li>
+            </ul>
+        </div>
+    </div>
+"""
+
+# The same slot without the optional presenters and audience level
+MOCK_DAY1_MINIMAL_BLOCK = """
+    <div class="relative">
+        <h2>
+            <a href="#Day-1">
+                <span class="font-medium">Talks: Day 1</span> /
+                <time datetime="2025-09-08">Monday, Sep 8</time>
+            </a>
+        </h2>
+        <div class="flex flex-wrap gap-4 lg:gap-8">
+            <div class="w-full md:w-48">
+                <h3>
+                    <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
+                    <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
+                </h3>
+            </div>
+            <ul>
+                <li>
+                    <section>
+                        <header>
+                            <div>
+                                <p class="text-sm">Main Ballroom</p>
+                            </div>
+                        </header>
+                        <h4>
+                            <a href="/talks/opening-keynote/">Opening Keynote</a>
+                        </h4>
+                    </section>
+                </li>
+            </ul>
+        </div>
+    </div>
+"""
+
+MOCK_DAY2_BLOCK = """
+    <div class="relative">
+        <h2>
+            <a href="#Day-2">
+                <span class="font-medium">Talks: Day 2</span> /
+                <time datetime="2025-09-09">Tuesday, Sep 9</time>
+            </a>
+        </h2>
+        <div class="flex flex-wrap gap-4 lg:gap-8">
+            <div class="w-full md:w-48">
+                <h3>
+                    <time datetime="2025-09-09T14:00:00-05:00">2:00 pm</time> to
+                    <time datetime="2025-09-09T15:00:00-05:00">3:00 pm</time>
+                </h3>
+            </div>
+            <ul>
+                <li>
+                    <section>
+                        <header>
+                            <div>
+                                <p class="text-sm">Room 101</p>
+                            </div>
+                        </header>
+                        <h4>
+                            <a href="/talks/django-tips/">Django Tips & Tricks</a>
+                        </h4>
+                        <div class="pt-6 mt-auto">
+                            <ul>
+                                <li>
+                                    <h6>Jane Smith</h6>
+                                </li>
+                            </ul>
+                        </div>
+                    </section>
+                </li>
+            </ul>
+        </div>
+    </div>
+"""
+
+
+def mock_schedule_page(*day_blocks: str) -> str:
+    """Wrap day blocks in the page skeleton the scraper expects."""
+    return "<html>\n<body>" + "".join(day_blocks) + "</body>\n</html>\n"
+
+
+MOCK_HTML_DAY1 = mock_schedule_page(MOCK_DAY1_BLOCK)
+MOCK_HTML_TWO_DAYS = mock_schedule_page(MOCK_DAY1_BLOCK, MOCK_DAY2_BLOCK)
+
+TWO_DAYS_URL = "https://example.com/two-days/"
+
+
+# Shared by every TestParseSectionEvent case; parse_section_event only copies them onto the Event
+SECTION_START = datetime(2025, 9, 8, 9, 0, tzinfo=CHICAGO_TZ)
+SECTION_END = datetime(2025, 9, 8, 10, 0, tzinfo=CHICAGO_TZ)
+
+FULL_SECTION_HTML = """
+<section>
+    <header>
+        <div>
+            <p class="text-sm">Main Ballroom</p>
+        </div>
+    </header>
+    <h4>
+        <a href="/talks/opening-keynote/">Opening Keynote</a>
+    </h4>
+    <div class="pt-6 mt-auto">
+        <ul>
+            <li>
+                <h6>John Doe</h6>
+            </li>
+            <li>
+                <h6>Jane Smith</h6>
+            </li>
+        </ul>
+    </div>
+    <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">Intermediate</span>
+</section>
+"""
+FULL_SECTION_EVENT = Event(
+    title="Opening Keynote",
+    room="Main Ballroom",
+    start=SECTION_START,
+    end=SECTION_END,
+    description="Presented by: John Doe, Jane Smith\nAudience level: Intermediate\nLocation: Main Ballroom\n\nMore info: https://2025.djangocon.us/talks/opening-keynote/",
+    url="https://2025.djangocon.us/talks/opening-keynote/",
+)
+
+# What the day-events and time-block fixtures' single slot parses to. Its times come from the
+# same ISO strings as their <time datetime> attributes, so they carry the parser's fixed offset
+OPENING_KEYNOTE_EVENT = Event(
+    title="Opening Keynote",
+    room="Main Ballroom",
+    description="Presented by: John Doe\nLocation: Main Ballroom\n\nMore info: https://2025.djangocon.us/talks/opening-keynote/",
+    start=datetime.fromisoformat("2025-09-08T09:00:00-05:00"),  # 9:00 AM CDT
+    end=datetime.fromisoformat("2025-09-08T10:00:00-05:00"),    # 10:00 AM CDT
+    url="https://2025.djangocon.us/talks/opening-keynote/",
 )
 
 
+@functools.lru_cache(maxsize=None)
+def first_tag(html: str, name: str, class_: str | None = None) -> Tag | None:
+    """Parse a test snippet once with lxml and return its first matching tag.
+    
+    Results are shared across every test that passes the same snippet, so callers must only read them.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    return soup.find(name, class_=class_) if class_ else soup.find(name)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _network_stub():
+    """Stub all HTTP for the whole session so no test can reach the network."""
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, text=MOCK_HTML_DAY1)
+        m.get(TWO_DAYS_URL, text=MOCK_HTML_TWO_DAYS)
+        yield m
+
+
+@pytest.fixture
+def network(_network_stub):
+    """Per-test view of the session stub with a clean request history.
+    
+    Tests override the catch-all page with network.get(url, ...). Registrations outlive the test,
+    so each test registers a URL of its own.
+    """
+    _network_stub.reset_mock()
+    return _network_stub
+
+
+@pytest.fixture(autouse=True)
+def _memory_cache(monkeypatch):
+    """Give CLI runs an in-memory HTTP cache so tests never write to the user's cache dir."""
+    monkeypatch.setattr(main_module, "cached_session", lambda: requests_cache.CachedSession(backend="memory"))
+
+
+@pytest.fixture(autouse=True)
+def _no_talk_fetch(monkeypatch):
+    """Skip talk-page fetches everywhere; tests of the fetch path restore the real function."""
+    monkeypatch.setattr(main_module, "fetch_talk_description", lambda talk_url, session=None: "")
+
+
 class TestCleanText:
     """Test the clean_text function."""
     
     @pytest.mark.parametrize("input_text,expected", [
         ("  hello   world  ", "hello world"),
         ("line1\nline2\tline3", "line1 line2 line3"),
+        ("already clean", "already clean"),
+        ("non\xa0breaking\r\nspace", "non breaking space"),
         (None, ""),
         ("", ""),
     ])
@@ -52,6 +287,7 @@ class TestParseDayDate:
     @pytest.mark.parametrize("input_text,expected_label,expected_date", [
         ("Talks: Day 1 / Monday, Sep 8", "Talks: Day 1", date(2025, 9, 8)),
         ("Sprints: Day 2 / Tuesday, Sep 9", "Sprints: Day 2", date(2025, 9, 9)),
+        ("Talks: Day 3 / Wednesday, September 10", "Talks: Day 3", date(2025, 9, 10)),  # fuzzy fallback
         ("Invalid format", None, None),
     ])
     def test_parse_day_date(self, input_text, expected_label, expected_date):
@@ -70,15 +306,30 @@ class TestToUtcZ:
     def test_to_utc_z_conversion(self):
         """Test timezone conversion to UTC Z format."""
         # Arrange
-        chicago_tz = tz.gettz("America/Chicago")
-        local_dt = datetime(2025, 9, 8, 14, 30, tzinfo=chicago_tz)
+        local_dt = datetime(2025, 9, 8, 14, 30, tzinfo=CHICAGO_TZ)
         
         # Act
         utc_z = to_utc_z(local_dt)
         
         # Assert
-        assert utc_z.endswith('Z')
-        assert len(utc_z) == 16  # YYYYMMDDTHHMMSSZ format
+        assert utc_z == "20250908T193000Z"  # 2:30 PM CDT = 7:30 PM UTC
+
+
+class TestParseIsoDatetime:
+    """Test the parse_iso_datetime function."""
+    
+    @pytest.mark.parametrize("input_text,expected", [
+        ("2025-09-08T09:00:00-05:00", datetime(2025, 9, 8, 14, 0, tzinfo=tz.UTC)),
+        ("2025-09-08T14:00:00Z", datetime(2025, 9, 8, 14, 0, tzinfo=tz.UTC)),
+        ("Sep 8 2025 2:00 PM UTC", datetime(2025, 9, 8, 14, 0, tzinfo=tz.UTC)),  # dateutil fallback
+    ])
+    def test_parse_iso_datetime(self, input_text, expected):
+        """Test ISO parsing with the dateutil fallback for non-ISO input."""
+        # Act
+        result = parse_iso_datetime(input_text)
+        
+        # Assert
+        assert result == expected
 
 
 class TestIcsEscape:
@@ -89,6 +340,8 @@ class TestIcsEscape:
         ("test; semicolon", "test\\; semicolon"),
         ("back\\slash", "back\\\\slash"),
         ("line1\nline2", "line1\\nline2"),
+        ("a\\, b;\nc", "a\\\\\\, b\\;\\nc"),
+        ("nothing to escape", "nothing to escape"),
     ])
     def test_ics_escape(self, input_text, expected):
         """Test ICS text escaping with various inputs."""
@@ -120,6 +373,78 @@ class TestFoldLine:
             # Each line should be <= 75 characters (except the continuation space)
             for line in lines[1:]:  # Skip first line, check continuation lines
                 assert len(line) <= 76  # 75 + 1 for continuation space
+    
+    @pytest.mark.parametrize("input_line,expected", [
+        ("x" * 75, "x" * 75),
+        ("x" * 76, "x" * 75 + "\r\n x"),
+        ("x" * 149, "x" * 75 + "\r\n " + "x" * 74),
+        ("x" * 150, "x" * 75 + "\r\n " + "x" * 74 + "\r\n x"),
+    ])
+    def test_fold_line_boundaries(self, input_line, expected):
+        """Test the first line holds 75 octets and each continuation 74 plus its leading space."""
+        # Act
+        result = fold_line(input_line)
+        
+        # Assert
+        assert result == expected
+    
+    def test_fold_line_multibyte(self):
+        """Test folding never splits a multi-byte UTF-8 character and stays within 75 octets."""
+        # Arrange
+        line = "SUMMARY:" + "Café ☕ " * 20
+        
+        # Act
+        folded = fold_line(line)
+        
+        # Assert
+        assert max(len(part.encode("utf-8")) for part in folded.split("\r\n")) <= 75
+        assert folded.replace("\r\n ", "") == line
+
+
+class TestMaybeFold:
+    """Test the maybe_fold function."""
+    
+    @pytest.mark.parametrize("input_line", [
+        "SUMMARY:Short title",
+        "SUMMARY:" + "x" * 80,
+        "SUMMARY:" + "é" * 40,  # under 75 chars but over 75 octets
+    ])
+    def test_maybe_fold_matches_fold_line(self, input_line):
+        """Test the short-ASCII shortcut never changes the result."""
+        # Act
+        result = maybe_fold(input_line)
+        
+        # Assert
+        assert result == fold_line(input_line)
+
+
+class TestFormatUid:
+    """Test the format_uid function."""
+    
+    def test_format_uid(self):
+        """Test 32 hex digits are grouped like a UUID with the calendar suffix."""
+        # Act
+        result = format_uid("0123456789abcdef0123456789abcdef")
+        
+        # Assert
+        assert result == "01234567-89ab-cdef-0123-456789abcdef@djangocon-2025"
+
+
+class TestAbsoluteUrl:
+    """Test the absolute_url function."""
+    
+    @pytest.mark.parametrize("href,expected", [
+        ("/talks/opening-keynote/", "https://2025.djangocon.us/talks/opening-keynote/"),
+        ("https://example.com/talk/", "https://example.com/talk/"),
+        ("", ""),
+    ])
+    def test_absolute_url(self, href, expected):
+        """Test site-relative links are resolved and absolute ones kept."""
+        # Act
+        result = absolute_url(href)
+        
+        # Assert
+        assert result == expected
 
 
 class TestHtmlParsing:
@@ -173,7 +498,7 @@ class TestHtmlParsing:
         """
         
         # Act
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         h2 = soup.find("h2")
         day_link = h2.find("a")
         day_text = clean_text(day_link.get_text(" "))
@@ -201,8 +526,8 @@ class TestIcsGeneration:
         events = [
             {
                 "title": "Test Event",
-                "start": datetime(2025, 9, 8, 9, 0, tzinfo=tz.gettz("America/Chicago")),
-                "end": datetime(2025, 9, 8, 10, 0, tzinfo=tz.gettz("America/Chicago")),
+                "start": datetime(2025, 9, 8, 9, 0, tzinfo=CHICAGO_TZ),
+                "end": datetime(2025, 9, 8, 10, 0, tzinfo=CHICAGO_TZ),
                 "room": "Main Ballroom",
                 "description": "A test event"
             }
@@ -224,212 +549,187 @@ class TestIcsGeneration:
         assert location == "Main Ballroom"
 
 
+@pytest.mark.integration
 class TestIntegration:
     """Integration tests for the complete workflow using mocked data."""
     
     def test_scrape_schedule_with_mock_html(self):
         """Test that scrape_schedule works with mocked HTML."""
-        # Arrange
-        mock_html = """
-        <html>
-        <body>
-            <div class="relative">
-                <h2>
-                    <a href="#Day-1">
-                        <span class="font-medium">Talks: Day 1</span> /
-                        <time datetime="2025-09-08">Monday, Sep 8</time>
-                    </a>
-                </h2>
-                <div class="flex flex-wrap gap-4 lg:gap-8">
-                    <div class="w-full md:w-48">
-                        <h3>
-                            <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
-                            <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
-                        </h3>
-                    </div>
-                    <ul>
-                        <li>
-                            <section>
-                                <header>
-                                    <div>
-                                        <p class="text-sm">Main Ballroom</p>
-                                    </div>
-                                </header>
-                                <h4>
-                                    <a href="/talks/opening-keynote/">Opening Keynote</a>
-                                </h4>
-                                <div class="pt-6 mt-auto">
-                                    <ul>
-                                        <li>
-                                            <h6>John Doe</h6>
-                                        </li>
-                                    </ul>
-                                </div>
-                                <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">Beginner</span>
-                            </section>
-                        </li>
-                    </ul>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
         # Act
-        with patch('requests.get') as mock_get:
-            mock_get.return_value.text = mock_html
-            events = scrape_schedule("https://example.com/schedule/")
+        events = scrape_schedule("https://example.com/schedule/")
         
         # Assert
         assert len(events) == 1, "Should have scraped 1 event"
         
         event = events[0]
-        assert event["title"] == "Opening Keynote"
-        assert event["room"] == "Main Ballroom"
-        assert "Presented by: John Doe" in event["description"]
-        assert "Audience level: Beginner" in event["description"]
-        assert "Location: Main Ballroom" in event["description"]
-        assert isinstance(event["start"], datetime)
-        assert isinstance(event["end"], datetime)
-        assert event["end"] > event["start"]
-    
-    def test_generate_ics_with_mock_events(self, tmp_path):
-        """Test that generate_ics creates a valid ICS file with mock events."""
+        assert event.title == "Opening Keynote"
+        assert event.room == "Main Ballroom"
+        assert "Presented by: John Doe" in event.description
+        assert "Audience level: Beginner" in event.description
+        assert "Location: Main Ballroom" in event.description
+        assert isinstance(event.start, datetime)
+        assert isinstance(event.end, datetime)
+        assert event.end > event.start
+
+    def test_scrape_schedule_uses_header_charset(self, network):
+        """Test that a charset given only in the Content-Type header decodes the page."""
         # Arrange
-        chicago_tz = tz.gettz("America/Chicago")
-        events = [
-            {
-                "title": "Test Event 1",
-                "start": datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz),
-                "end": datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz),
-                "room": "Test Room",
-                "description": "A test event for integration testing"
-            },
-            {
-                "title": "Test Event 2",
-                "start": datetime(2025, 9, 8, 14, 0, tzinfo=chicago_tz),
-                "end": datetime(2025, 9, 8, 15, 0, tzinfo=chicago_tz),
-                "room": "Another Room",
-                "description": "Another test event"
-            }
-        ]
-        
-        ics_file = tmp_path / "test.ics"
-        
+        schedule_html = mock_schedule_page(MOCK_DAY1_BLOCK.replace("Opening Keynote", "Ωmega talk"))
+        network.get(
+            "https://example.com/greek-schedule/",
+            content=schedule_html.encode("iso-8859-7"),
+            headers={"Content-Type": "text/html; charset=iso-8859-7"},
+        )
+
         # Act
-        generate_ics(events, str(ics_file))
-        
+        result = scrape_schedule("https://example.com/greek-schedule/")
+
         # Assert
-        assert ics_file.exists(), "ICS file should be created"
-        
-        content = ics_file.read_text(encoding='utf-8')
-        
-        assert content.startswith("BEGIN:VCALENDAR"), "Should start with VCALENDAR"
-        assert content.endswith("END:VCALENDAR"), "Should end with VCALENDAR"
-        
-        event_count = content.count("BEGIN:VEVENT")
-        assert event_count == 2, f"Should have 2 events, found {event_count}"
-        
-        assert "Test Event 1" in content
-        assert "Test Event 2" in content
-        assert "Test Room" in content
-        assert "Another Room" in content
-        
-        # Verify datetime format (should be in UTC Z format)
-        assert "20250908T140000Z" in content  # 9:00 AM CDT = 2:00 PM UTC
-        assert "20250908T190000Z" in content  # 2:00 PM CDT = 7:00 PM UTC
-    
-    def test_end_to_end_workflow_with_mock_data(self, tmp_path):
-        """Test the complete workflow from mocked HTML to ICS file."""
+        assert [event.title for event in result] == ["Ωmega talk"]
+
+    def test_scrape_schedule_with_wrapped_h2(self, network):
+        """Test that a header nested below its day container still finds that container."""
         # Arrange
-        mock_html = """
-        <html>
-        <body>
-            <div class="relative">
-                <h2>
-                    <a href="#Day-1">
-                        <span class="font-medium">Talks: Day 1</span> /
-                        <time datetime="2025-09-08">Monday, Sep 8</time>
-                    </a>
-                </h2>
-                <div class="flex flex-wrap gap-4 lg:gap-8">
-                    <div class="w-full md:w-48">
-                        <h3>
-                            <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
-                            <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
-                        </h3>
-                    </div>
-                    <ul>
-                        <li>
-                            <section>
-                                <header>
-                                    <div>
-                                        <p class="text-sm">Main Ballroom</p>
-                                    </div>
-                                </header>
-                                <h4>
-                                    <a href="/talks/opening-keynote/">Opening Keynote</a>
-                                </h4>
-                                <div class="pt-6 mt-auto">
-                                    <ul>
-                                        <li>
-                                            <h6>John Doe</h6>
-                                        </li>
-                                    </ul>
-                                </div>
-                            </section>
-                        </li>
-                    </ul>
-                </div>
-            </div>
-            <div class="relative">
-                <h2>
-                    <a href="#Day-2">
-                        <span class="font-medium">Talks: Day 2</span> /
-                        <time datetime="2025-09-09">Tuesday, Sep 9</time>
-                    </a>
-                </h2>
-                <div class="flex flex-wrap gap-4 lg:gap-8">
-                    <div class="w-full md:w-48">
-                        <h3>
-                            <time datetime="2025-09-09T14:00:00-05:00">2:00 pm</time> to
-                            <time datetime="2025-09-09T15:00:00-05:00">3:00 pm</time>
-                        </h3>
-                    </div>
-                    <ul>
-                        <li>
-                            <section>
-                                <header>
-                                    <div>
-                                        <p class="text-sm">Room 101</p>
-                                    </div>
-                                </header>
-                                <h4>
-                                    <a href="/talks/django-tips/">Django Tips & Tricks</a>
-                                </h4>
-                                <div class="pt-6 mt-auto">
-                                    <ul>
-                                        <li>
-                                            <h6>Jane Smith</h6>
-                                        </li>
-                                    </ul>
-                                </div>
-                            </section>
-                        </li>
-                    </ul>
+        wrapped_block = MOCK_DAY1_BLOCK.replace("<h2>", '<div class="sticky"><h2>').replace("</h2>", "</h2></div>")
+        network.get("https://example.com/wrapped-h2/", text=mock_schedule_page(wrapped_block))
+
+        # Act
+        result = scrape_schedule("https://example.com/wrapped-h2/")
+
+        # Assert
+        assert [event.title for event in result] == ["Opening Keynote"]
+
+    def test_scrape_schedule_prefetches_talk_descriptions(self, monkeypatch, network):
+        """Test that talk pages are fetched up front and their descriptions land on the events."""
+        # Arrange
+        monkeypatch.setattr(main_module, "fetch_talk_description", fetch_talk_description)
+        schedule_html = """
+        <div class="relative">
+            <h2>
+                <a href="#Day-1">
+                    <span class="font-medium">Talks: Day 1</span> /
+                    <time datetime="2025-09-08">Monday, Sep 8</time>
+                </a>
+            </h2>
+            <div class="flex flex-wrap gap-4 lg:gap-8">
+                <div class="w-full md:w-48">
+                    <h3>
+                        <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
+                        <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
+                    </h3>
                 </div>
+                <section><h4><a href="/talks/prefetched-keynote/">Opening Keynote</a></h4></section>
+                <section><h4><a href="/talks/prefetched-tips/">Django Tips</a></h4></section>
             </div>
-        </body>
-        </html>
+        </div>
         """
+        talk_html = """
+        <h2>About this session</h2>
+        <div class="prose"><p>Talk details.</p></div>
+        """
+        talk_urls = [
+            "https://2025.djangocon.us/talks/prefetched-keynote/",
+            "https://2025.djangocon.us/talks/prefetched-tips/",
+        ]
+        network.get("https://example.com/prefetch-schedule/", text=schedule_html)
+        for talk_url in talk_urls:
+            network.get(talk_url, text=talk_html)
+        
+        # Act
+        result = scrape_schedule("https://example.com/prefetch-schedule/")
+        
+        # Assert
+        assert [event.talk_description for event in result] == ["Talk details.", "Talk details."]
+        # Schedule page first, then one fetch per talk in whatever order the pool finishes them
+        fetched = [request.url for request in network.request_history]
+        assert fetched[0] == "https://example.com/prefetch-schedule/"
+        assert sorted(fetched[1:]) == talk_urls
+
+    def test_scrape_schedule_skips_talks_that_are_not_parsed(self, monkeypatch, network):
+        """Test that talk links the parse throws away are never fetched."""
+        # Arrange
+        monkeypatch.setattr(main_module, "fetch_talk_description", fetch_talk_description)
+        schedule_html = mock_schedule_page(
+            # Not a day header
+            '<div class="relative"><h2><a href="#Schedule">Schedule / Monday, Sep 8</a></h2>'
+            '<div class="flex flex-wrap gap-4 lg:gap-8"><h3>'
+            '<time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to'
+            '<time datetime="2025-09-08T10:00:00-05:00">10:00 am</time></h3>'
+            '<section><h4><a href="/talks/skipped-header/">Skipped</a></h4></section></div></div>',
+            # A slot with one time, an empty title, and a link that isn't the h4's first <a>
+            '<div class="relative"><h2><a href="#Day-1">Talks: Day 1 / Monday, Sep 8</a></h2>'
+            '<div class="flex flex-wrap gap-4 lg:gap-8"><h3>'
+            '<time datetime="2025-09-08T09:00:00-05:00">9:00 am</time></h3>'
+            '<section><h4><a href="/talks/skipped-slot/">Skipped</a></h4></section></div>'
+            '<div class="flex flex-wrap gap-4 lg:gap-8"><h3>'
+            '<time datetime="2025-09-08T11:00:00-05:00">11:00 am</time> to'
+            '<time datetime="2025-09-08T12:00:00-05:00">12:00 pm</time></h3>'
+            '<section><h4><a href="/talks/skipped-title/"> </a></h4></section>'
+            '<section><h4><a>Lunch</a><a href="/talks/skipped-second-link/">Menu</a></h4></section>'
+            '</div></div>',
+        )
+        network.get("https://example.com/skipped-talks/", text=schedule_html)
+
+        # Act
+        result = scrape_schedule("https://example.com/skipped-talks/")
+
+        # Assert
+        assert [(event.title, event.url) for event in result] == [("Lunch", "")]
+        assert [request.url for request in network.request_history] == ["https://example.com/skipped-talks/"]
+
+    def test_generate_ics_with_mock_events(self, tmp_path):
+        """Test that generate_ics creates a valid ICS file with mock events."""
+        # Arrange
+        events = [
+            Event(
+                title="Test Event 1",
+                start=datetime(2025, 9, 8, 9, 0, tzinfo=CHICAGO_TZ),
+                end=datetime(2025, 9, 8, 10, 0, tzinfo=CHICAGO_TZ),
+                room="Test Room",
+                description="A test event for integration testing",
+            ),
+            Event(
+                title="Test Event 2",
+                start=datetime(2025, 9, 8, 14, 0, tzinfo=CHICAGO_TZ),
+                end=datetime(2025, 9, 8, 15, 0, tzinfo=CHICAGO_TZ),
+                room="Another Room",
+                description="Another test event",
+            )
+        ]
+        
+        ics_file = tmp_path / "test.ics"
         
+        # Act
+        generate_ics(events, str(ics_file))
+        
+        # Assert
+        assert ics_file.exists(), "ICS file should be created"
+        
+        content = ics_file.read_text(encoding='utf-8')
+        
+        assert content.startswith("BEGIN:VCALENDAR"), "Should start with VCALENDAR"
+        assert content.endswith("END:VCALENDAR"), "Should end with VCALENDAR"
+        
+        event_count = content.count("BEGIN:VEVENT")
+        assert event_count == 2, f"Should have 2 events, found {event_count}"
+        
+        assert "Test Event 1" in content
+        assert "Test Event 2" in content
+        assert "Test Room" in content
+        assert "Another Room" in content
+        
+        # Verify datetime format (should be in UTC Z format)
+        assert "20250908T140000Z" in content  # 9:00 AM CDT = 2:00 PM UTC
+        assert "20250908T190000Z" in content  # 2:00 PM CDT = 7:00 PM UTC
+    
+    def test_end_to_end_workflow_with_mock_data(self, tmp_path):
+        """Test the complete workflow from mocked HTML to ICS file."""
+        # Arrange
         ics_file = tmp_path / "test.ics"
         
         # Act
-        with patch('requests.get') as mock_get:
-            mock_get.return_value.text = mock_html
-            events = scrape_schedule("https://example.com/schedule/")
-            generate_ics(events, str(ics_file))
+        events = scrape_schedule(TWO_DAYS_URL)
+        generate_ics(events, str(ics_file))
         
         # Assert
         assert ics_file.exists(), "ICS file should be created"
@@ -454,57 +754,10 @@ class TestIntegration:
     def test_cli_command_execution(self, tmp_path):
         """Test that the CLI command works correctly."""
         # Arrange
-        mock_html = """
-        <html>
-        <body>
-            <div class="relative">
-                <h2>
-                    <a href="#Day-1">
-                        <span class="font-medium">Talks: Day 1</span> /
-                        <time datetime="2025-09-08">Monday, Sep 8</time>
-                    </a>
-                </h2>
-                <div class="flex flex-wrap gap-4 lg:gap-8">
-                    <div class="w-full md:w-48">
-                        <h3>
-                            <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
-                            <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
-                        </h3>
-                    </div>
-                    <ul>
-                        <li>
-                            <section>
-                                <header>
-                                    <div>
-                                        <p class="text-sm">Main Ballroom</p>
-                                    </div>
-                                </header>
-                                <h4>
-                                    <a href="/talks/opening-keynote/">Opening Keynote</a>
-                                </h4>
-                                <div class="pt-6 mt-auto">
-                                    <ul>
-                                        <li>
-                                            <h6>John Doe</h6>
-                                        </li>
-                                    </ul>
-                                </div>
-                            </section>
-                        </li>
-                    </ul>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
         ics_file = tmp_path / "test.ics"
         
         # Act
-        with patch('requests.get') as mock_get:
-            mock_get.return_value.text = mock_html
-            with patch('sys.argv', ['main.py', '--out', str(ics_file)]):
-                result = main()
+        result = main(['--out', str(ics_file)])
         
         # Assert
         assert result == 0, "CLI should return success code"
@@ -516,74 +769,65 @@ class TestIntegration:
         assert "Opening Keynote" in content
         assert "Main Ballroom" in content
     
-    def test_cli_command_with_custom_url(self, tmp_path):
+    def test_cli_command_with_custom_url(self, tmp_path, network):
         """Test CLI command with custom URL parameter."""
         # Arrange
-        mock_html = """
-        <html>
-        <body>
-            <div class="relative">
-                <h2>
-                    <a href="#Day-1">
-                        <span class="font-medium">Talks: Day 1</span> /
-                        <time datetime="2025-09-08">Monday, Sep 8</time>
-                    </a>
-                </h2>
-                <div class="flex flex-wrap gap-4 lg:gap-8">
-                    <div class="w-full md:w-48">
-                        <h3>
-                            <time datetime="2025-09-08T09:00:00-05:00">9:00 am</time> to
-                            <time datetime="2025-09-08T10:00:00-05:00">10:00 am</time>
-                        </h3>
-                    </div>
-                    <ul>
-                        <li>
-                            <section>
-                                <header>
-                                    <div>
-                                        <p class="text-sm">Main Ballroom</p>
-                                    </div>
-                                </header>
-                                <h4>
-                                    <a href="/talks/opening-keynote/">Opening Keynote</a>
-                                </h4>
-                            </section>
-                        </li>
-                    </ul>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
+        network.get("https://custom.example.com/schedule/", text=mock_schedule_page(MOCK_DAY1_MINIMAL_BLOCK))
         ics_file = tmp_path / "test.ics"
         
         # Act
-        with patch('requests.get') as mock_get:
-            mock_get.return_value.text = mock_html
-            with patch('main.fetch_talk_description') as mock_fetch:
-                mock_fetch.return_value = ""
-                with patch('sys.argv', ['main.py', '--url', 'https://custom.example.com/schedule/', '--out', str(ics_file)]):
-                    result = main()
+        result = main(['--url', 'https://custom.example.com/schedule/', '--out', str(ics_file)])
         
         # Assert
         assert result == 0, "CLI should return success code"
         assert ics_file.exists(), "Output file should be created"
         
-        # Verify the custom URL was called (and the talk description fetch)
-        assert mock_get.call_count >= 1, "Should have called requests.get at least once"
-        assert mock_get.call_args_list[0] == (('https://custom.example.com/schedule/',), {'timeout': 30})
+        # Verify the custom URL was the one fetched
+        assert network.call_count == 1, "Talk pages are patched, so only the schedule is fetched"
+        assert network.request_history[0].url == "https://custom.example.com/schedule/"
+        assert network.request_history[0].timeout == 30
         
         content = ics_file.read_text(encoding='utf-8')
         
         assert "BEGIN:VCALENDAR" in content
         assert "Opening Keynote" in content
+        assert "DESCRIPTION:Location: Main Ballroom\\n\\nMore info:" in content, "No presenters or audience level"
+    
+    def test_cli_command_no_cache(self, tmp_path, network, monkeypatch):
+        """Test --no-cache refetches the schedule for that run only and leaves the cache enabled."""
+        # Arrange
+        cache = requests_cache.CachedSession(backend="memory")
+        monkeypatch.setattr(main_module, "cached_session", lambda: cache)
+        argv = ['--url', 'https://example.com/cached-schedule/', '--out', str(tmp_path / "test.ics")]
+        
+        # Act
+        results = [main(argv), main(argv), main([*argv, '--no-cache'])]
+        
+        # Assert
+        assert results == [0, 0, 0]
+        assert network.call_count == 2, "Second run is served from the cache; --no-cache refetches"
+        assert cache.settings.disabled is False
+
+    def test_cli_command_unusable_cache(self, tmp_path, monkeypatch, capsys):
+        """Test a cache that can't be opened is reported as an error rather than a traceback."""
+        # Arrange
+        def cached_session():
+            raise PermissionError("cache dir is read-only")
+
+        monkeypatch.setattr(main_module, "cached_session", cached_session)
+
+        # Act
+        result = main(['--out', str(tmp_path / "test.ics")])
+
+        # Assert
+        assert result == 1
+        assert capsys.readouterr().out == "Error: cache dir is read-only\n"
 
 
 class TestParseDayEvents:
     """Test the parse_day_events function."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_h2_with_events(self):
         """Fixture providing a valid h2 element with events."""
         html = """
@@ -625,19 +869,17 @@ class TestParseDayEvents:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("h2")
+        return first_tag(html, "h2")
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def h2_without_link(self):
         """Fixture providing an h2 element without a link."""
         html = """
         <h2>Talks: Day 1 / Monday, Sep 8</h2>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("h2")
+        return first_tag(html, "h2")
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def h2_with_schedule_text(self):
         """Fixture providing an h2 element with 'Schedule' text."""
         html = """
@@ -645,55 +887,34 @@ class TestParseDayEvents:
             <a href="#schedule">Schedule Overview</a>
         </h2>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("h2")
+        return first_tag(html, "h2")
     
     def test_parse_day_events_valid_h2(self, valid_h2_with_events):
         """Test parsing events from a valid h2 element."""
         # Arrange
-        # The datetime strings in the HTML are "2025-09-08T09:00:00-05:00" and "2025-09-08T10:00:00-05:00"
-        # which parse to 9:00 AM and 10:00 AM in CDT (UTC-5)
-        expected = [
-            {
-                "title": "Opening Keynote",
-                "room": "Main Ballroom",
-                "description": "Presented by: John Doe\nLocation: Main Ballroom\n\nMore info: https://2025.djangocon.us/talks/opening-keynote/",
-                "start": datetime(2025, 9, 8, 9, 0, tzinfo=tz.tzoffset(None, -5*3600)),  # 9:00 AM CDT
-                "end": datetime(2025, 9, 8, 10, 0, tzinfo=tz.tzoffset(None, -5*3600)),    # 10:00 AM CDT
-                "url": "https://2025.djangocon.us/talks/opening-keynote/",
-                "talk_description": "",
-            }
-        ]
+        expected = [OPENING_KEYNOTE_EVENT]
         
         # Act
-        with patch('main.fetch_talk_description') as mock_fetch:
-            mock_fetch.return_value = ""
-            result = parse_day_events(valid_h2_with_events)
+        result = parse_day_events(valid_h2_with_events)
         
         # Assert
         assert result == expected
     
     def test_parse_day_events_no_link(self, h2_without_link):
         """Test parsing events from h2 without link returns empty list."""
-        # Arrange
-        expected = []
-        
         # Act
         result = parse_day_events(h2_without_link)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_day_events_schedule_text(self, h2_with_schedule_text):
         """Test parsing events from h2 with 'Schedule' text returns empty list."""
-        # Arrange
-        expected = []
-        
         # Act
         result = parse_day_events(h2_with_schedule_text)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_day_events_invalid_day_date(self):
         """Test parsing events with invalid day date format."""
@@ -703,15 +924,13 @@ class TestParseDayEvents:
             <a href="#Day-1">Invalid day format</a>
         </h2>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        h2 = soup.find("h2")
-        expected = []
+        h2 = first_tag(html, "h2")
         
         # Act
         result = parse_day_events(h2)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_day_events_no_day_container(self):
         """Test parsing events when day container is not found."""
@@ -724,21 +943,19 @@ class TestParseDayEvents:
             </a>
         </h2>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        h2 = soup.find("h2")
-        expected = []
+        h2 = first_tag(html, "h2")
         
         # Act
         result = parse_day_events(h2)
         
         # Assert
-        assert result == expected
+        assert result == []
 
 
 class TestParseTimeBlockEvents:
     """Test the parse_time_block_events function."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_time_block(self):
         """Fixture providing a valid time block with events."""
         html = """
@@ -772,10 +989,9 @@ class TestParseTimeBlockEvents:
             </ul>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("div", class_="flex flex-wrap gap-4 lg:gap-8")
+        return first_tag(html, "div", "flex flex-wrap gap-4 lg:gap-8")
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def time_block_no_h3(self):
         """Fixture providing a time block without h3 element."""
         html = """
@@ -789,10 +1005,9 @@ class TestParseTimeBlockEvents:
             </ul>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("div", class_="flex flex-wrap gap-4 lg:gap-8")
+        return first_tag(html, "div", "flex flex-wrap gap-4 lg:gap-8")
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def time_block_wrong_time_elements(self):
         """Fixture providing a time block with wrong number of time elements."""
         html = """
@@ -804,10 +1019,9 @@ class TestParseTimeBlockEvents:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("div", class_="flex flex-wrap gap-4 lg:gap-8")
+        return first_tag(html, "div", "flex flex-wrap gap-4 lg:gap-8")
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def time_block_invalid_datetime(self):
         """Fixture providing a time block with invalid datetime attributes."""
         html = """
@@ -820,66 +1034,42 @@ class TestParseTimeBlockEvents:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("div", class_="flex flex-wrap gap-4 lg:gap-8")
+        return first_tag(html, "div", "flex flex-wrap gap-4 lg:gap-8")
     
     def test_parse_time_block_events_valid(self, valid_time_block):
         """Test parsing events from a valid time block."""
         # Arrange
-        # The datetime strings in the HTML are "2025-09-08T09:00:00-05:00" and "2025-09-08T10:00:00-05:00"
-        # which parse to 9:00 AM and 10:00 AM in CDT (UTC-5)
-        expected = [
-            {
-                "title": "Opening Keynote",
-                "room": "Main Ballroom",
-                "description": "Presented by: John Doe\nLocation: Main Ballroom\n\nMore info: https://2025.djangocon.us/talks/opening-keynote/",
-                "start": datetime(2025, 9, 8, 9, 0, tzinfo=tz.tzoffset(None, -5*3600)),  # 9:00 AM CDT
-                "end": datetime(2025, 9, 8, 10, 0, tzinfo=tz.tzoffset(None, -5*3600)),    # 10:00 AM CDT
-                "url": "https://2025.djangocon.us/talks/opening-keynote/",
-                "talk_description": "",
-            }
-        ]
+        expected = [OPENING_KEYNOTE_EVENT]
         
         # Act
-        with patch('main.fetch_talk_description') as mock_fetch:
-            mock_fetch.return_value = ""
-            result = parse_time_block_events(valid_time_block)
+        result = parse_time_block_events(valid_time_block)
         
         # Assert
         assert result == expected
     
     def test_parse_time_block_events_no_h3(self, time_block_no_h3):
         """Test parsing events from time block without h3 returns empty list."""
-        # Arrange
-        expected = []
-        
         # Act
         result = parse_time_block_events(time_block_no_h3)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_time_block_events_wrong_time_elements(self, time_block_wrong_time_elements):
         """Test parsing events from time block with wrong number of time elements."""
-        # Arrange
-        expected = []
-        
         # Act
         result = parse_time_block_events(time_block_wrong_time_elements)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_time_block_events_invalid_datetime(self, time_block_invalid_datetime):
         """Test parsing events from time block with invalid datetime returns empty list."""
-        # Arrange
-        expected = []
-        
         # Act
         result = parse_time_block_events(time_block_invalid_datetime)
         
         # Assert
-        assert result == expected
+        assert result == []
     
     def test_parse_time_block_events_missing_datetime_attributes(self):
         """Test parsing events from time block with missing datetime attributes."""
@@ -894,21 +1084,19 @@ class TestParseTimeBlockEvents:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        time_block = soup.find("div", class_="flex flex-wrap gap-4 lg:gap-8")
-        expected = []
+        time_block = first_tag(html, "div", "flex flex-wrap gap-4 lg:gap-8")
         
         # Act
         result = parse_time_block_events(time_block)
         
         # Assert
-        assert result == expected
+        assert result == []
 
 
 class TestFetchTalkDescription:
     """Test the fetch_talk_description function."""
     
-    def test_fetch_talk_description_with_mock_response(self):
+    def test_fetch_talk_description_with_mock_response(self, network):
         """Test fetching talk description with mocked response."""
         # Arrange
         mock_html = """
@@ -922,17 +1110,15 @@ class TestFetchTalkDescription:
         </body>
         </html>
         """
+        network.get("https://example.com/talks/described/", text=mock_html)
         
         # Act
-        with patch('requests.get') as mock_get:
-            mock_response = mock_get.return_value
-            mock_response.text = mock_html
-            mock_response.raise_for_status.return_value = None
-            result = fetch_talk_description("https://example.com/talk")
+        result = fetch_talk_description("https://example.com/talks/described/")
         
         # Assert
         assert result == "This is a test talk description.\n\nIt has multiple paragraphs."
-        mock_get.assert_called_once_with("https://example.com/talk", timeout=10)
+        assert network.call_count == 1
+        assert network.last_request.timeout == 10
     
     def test_fetch_talk_description_empty_url(self):
         """Test fetching talk description with empty URL."""
@@ -942,266 +1128,199 @@ class TestFetchTalkDescription:
         # Assert
         assert result == ""
     
-    def test_fetch_talk_description_no_about_section(self):
+    def test_fetch_talk_description_no_about_section(self, network):
         """Test fetching talk description when no about section exists."""
         # Arrange
-        mock_html = "<html><body><h2>Other section</h2></body></html>"
-        
-        # Act
-        with patch('requests.get') as mock_get:
-            mock_response = mock_get.return_value
-            mock_response.text = mock_html
-            mock_response.raise_for_status.return_value = None
-            result = fetch_talk_description("https://example.com/talk")
+        network.get("https://example.com/talks/no-about/", text="<html><body><h2>Other section</h2></body></html>")
         
-        # Assert
-        assert result == ""
-    
-    def test_fetch_talk_description_request_error(self):
-        """Test fetching talk description when request fails."""
         # Act
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = requests.RequestException("Network error")
-            result = fetch_talk_description("https://example.com/talk")
+        result = fetch_talk_description("https://example.com/talks/no-about/")
         
         # Assert
         assert result == ""
 
-
-class TestParseSectionEvent:
-    """Test the parse_section_event function."""
-    
-    @pytest.fixture
-    def valid_section_with_all_fields(self):
-        """Fixture providing a section with all possible fields."""
-        html = """
-        <section>
-            <header>
-                <div>
-                    <p class="text-sm">Main Ballroom</p>
-                </div>
-            </header>
-            <h4>
-                <a href="/talks/opening-keynote/">Opening Keynote</a>
-            </h4>
-            <div class="pt-6 mt-auto">
-                <ul>
-                    <li>
-                        <h6>John Doe</h6>
-                    </li>
-                    <li>
-                        <h6>Jane Smith</h6>
-                    </li>
-                </ul>
-            </div>
-            <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">Intermediate</span>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("section")
-    
-    @pytest.fixture
-    def section_without_h4(self):
-        """Fixture providing a section without h4 element."""
-        html = """
-        <section>
-            <header>
-                <div>
-                    <p class="text-sm">Main Ballroom</p>
-                </div>
-            </header>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("section")
-    
-    @pytest.fixture
-    def section_h4_without_link(self):
-        """Fixture providing a section with h4 but no link."""
-        html = """
-        <section>
-            <h4>Opening Keynote</h4>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("section")
-    
-    @pytest.fixture
-    def section_with_all_level_audience(self):
-        """Fixture providing a section with 'All' audience level."""
-        html = """
-        <section>
-            <h4>Opening Keynote</h4>
-            <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">All</span>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("section")
-    
-    @pytest.fixture
-    def minimal_section(self):
-        """Fixture providing a minimal section with only title."""
-        html = """
-        <section>
-            <h4>Minimal Event</h4>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.find("section")
-    
-    @pytest.fixture
-    def chicago_tz(self):
-        """Fixture providing Chicago timezone."""
-        return tz.gettz("America/Chicago")
-    
-    def test_parse_section_event_complete(self, valid_section_with_all_fields, chicago_tz):
-        """Test parsing a complete section event with all fields."""
+    def test_fetch_talk_description_xml_declaration(self, network):
+        """Test a talk page that opens with an XML declaration naming its encoding."""
         # Arrange
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = {
-            "title": "Opening Keynote",
-            "room": "Main Ballroom",
-            "start": start_dt,
-            "end": end_dt,
-            "description": "Presented by: John Doe, Jane Smith\nAudience level: Intermediate\nLocation: Main Ballroom\n\nMore info: https://2025.djangocon.us/talks/opening-keynote/",
-            "url": "https://2025.djangocon.us/talks/opening-keynote/",
-            "talk_description": "",
-        }
-        
+        mock_html = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html><body><h2>About this session</h2><div class="prose"><p>Café talk.</p></div></body></html>'
+        )
+        network.get("https://example.com/talks/xml-declaration/", content=mock_html.encode())
+
         # Act
-        with patch('main.fetch_talk_description') as mock_fetch:
-            mock_fetch.return_value = ""
-            result = parse_section_event(valid_section_with_all_fields, start_dt, end_dt)
-        
+        result = fetch_talk_description("https://example.com/talks/xml-declaration/")
+
         # Assert
-        assert result == expected
-    
-    def test_parse_section_event_no_h4(self, section_without_h4, chicago_tz):
-        """Test parsing section without h4 returns None."""
+        assert result == "Café talk."
+
+    def test_fetch_talk_description_uses_header_charset(self, network):
+        """Test that a charset given only in the Content-Type header decodes the talk page."""
         # Arrange
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = None
-        
+        mock_html = '<html><body><h2>About this session</h2><div class="prose"><p>Ωmega talk.</p></div></body></html>'
+        network.get(
+            "https://example.com/talks/greek/",
+            content=mock_html.encode("iso-8859-7"),
+            headers={"Content-Type": "text/html; charset=iso-8859-7"},
+        )
+
         # Act
-        result = parse_section_event(section_without_h4, start_dt, end_dt)
-        
+        result = fetch_talk_description("https://example.com/talks/greek/")
+
         # Assert
-        assert result == expected
-    
-    def test_parse_section_event_h4_without_link(self, section_h4_without_link, chicago_tz):
-        """Test parsing section with h4 but no link."""
+        assert result == "Ωmega talk."
+
+    @pytest.mark.parametrize("body", [
+        pytest.param(b"", id="empty"),
+        pytest.param(b" \n", id="whitespace"),
+    ])
+    def test_fetch_talk_description_empty_body(self, network, capsys, body):
+        """Test an empty talk page yields no description and no warning."""
         # Arrange
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = {
-            "title": "Opening Keynote",
-            "room": "",
-            "start": start_dt,
-            "end": end_dt,
-            "description": "",
-            "url": "",
-            "talk_description": "",
-        }
-        
+        network.get(f"https://example.com/talks/empty-body-{len(body)}/", content=body)
+
         # Act
-        result = parse_section_event(section_h4_without_link, start_dt, end_dt)
-        
+        result = fetch_talk_description(f"https://example.com/talks/empty-body-{len(body)}/")
+
         # Assert
-        assert result == expected
-    
-    def test_parse_section_event_all_audience_level(self, section_with_all_level_audience, chicago_tz):
-        """Test parsing section with 'All' audience level is not included in description."""
+        assert result == ""
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("response", [
+        pytest.param({"exc": requests.ConnectionError("Network error")}, id="network_error"),
+        pytest.param({"status_code": 404, "text": "Not Found"}, id="http_error"),
+    ])
+    def test_fetch_talk_description_request_error(self, network, response):
+        """Test fetching talk description when the request fails or returns an error status."""
         # Arrange
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = {
-            "title": "Opening Keynote",
-            "room": "",
-            "start": start_dt,
-            "end": end_dt,
-            "description": "",
-            "url": "",
-            "talk_description": "",
-        }
+        network.get("https://example.com/talks/broken/", **response)
         
         # Act
-        result = parse_section_event(section_with_all_level_audience, start_dt, end_dt)
+        result = fetch_talk_description("https://example.com/talks/broken/")
         
         # Assert
-        assert result == expected
+        assert result == ""
+
+
+class TestFetchTalkDescriptions:
+    """Test the fetch_talk_descriptions function."""
     
-    def test_parse_section_event_minimal(self, minimal_section, chicago_tz):
-        """Test parsing minimal section with only title."""
+    def test_fetch_talk_descriptions_keyed_by_url(self):
+        """Test descriptions are returned per URL and duplicate URLs are fetched once."""
         # Arrange
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = {
-            "title": "Minimal Event",
-            "room": "",
-            "start": start_dt,
-            "end": end_dt,
-            "description": "",
-            "url": "",
-            "talk_description": "",
-        }
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+        expected = {"https://example.com/a": "About a", "https://example.com/b": "About b"}
         
         # Act
-        result = parse_section_event(minimal_section, start_dt, end_dt)
+        with patch('main.fetch_talk_description', side_effect=lambda url, session: f"About {url[-1]}") as mock_fetch:
+            result = fetch_talk_descriptions(urls)
         
         # Assert
         assert result == expected
+        assert mock_fetch.call_count == 2
+
+
+class TestParseSectionEvent:
+    """Test the parse_section_event function."""
     
-    def test_parse_section_event_empty_title(self, chicago_tz):
-        """Test parsing section with empty title returns None."""
+    @pytest.mark.parametrize("html,expected", [
+        pytest.param(
+            FULL_SECTION_HTML,
+            FULL_SECTION_EVENT,
+            id="complete",
+        ),
+        pytest.param(
+            """
+            <section>
+                <header>
+                    <div>
+                        <p class="text-sm">Main Ballroom</p>
+                    </div>
+                </header>
+            </section>
+            """,
+            None,
+            id="no_h4",
+        ),
+        pytest.param(
+            "<section><h4>Opening Keynote</h4></section>",
+            Event(title="Opening Keynote", start=SECTION_START, end=SECTION_END),
+            id="h4_without_link",
+        ),
+        pytest.param(
+            """
+            <section>
+                <h4>Opening Keynote</h4>
+                <span class="px-2 py-[.125rem] text-sm font-bold text-white bg-black rounded">All</span>
+            </section>
+            """,
+            Event(title="Opening Keynote", start=SECTION_START, end=SECTION_END),
+            id="all_audience_level_omitted",
+        ),
+        pytest.param(
+            "<section><h4>Minimal Event</h4></section>",
+            Event(title="Minimal Event", start=SECTION_START, end=SECTION_END),
+            id="minimal",
+        ),
+        pytest.param(
+            "<section><h4></h4></section>",
+            None,
+            id="empty_title",
+        ),
+        pytest.param(
+            """
+            <section>
+                <h4>Event Without Presenters</h4>
+                <p class="text-sm">Room 101</p>
+            </section>
+            """,
+            Event(
+                title="Event Without Presenters",
+                room="Room 101",
+                start=SECTION_START,
+                end=SECTION_END,
+                description="Location: Room 101",
+            ),
+            id="no_presenters",
+        ),
+        pytest.param(
+            """
+            <section>
+                <h4>Panel</h4>
+                <div class="pt-6 mt-auto"><h6>John Doe</h6></div>
+                <div class="pt-6 mt-auto"><h6>Jane Smith</h6></div>
+            </section>
+            """,
+            Event(
+                title="Panel",
+                start=SECTION_START,
+                end=SECTION_END,
+                description="Presented by: John Doe",
+            ),
+            id="only_first_presenter_block",
+        ),
+    ])
+    def test_parse_section_event(self, html, expected):
+        """Test parsing a schedule section into an Event, or None when it has no title."""
         # Arrange
-        html = """
-        <section>
-            <h4></h4>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        section = soup.find("section")
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = None
+        section = first_tag(html, "section")
         
         # Act
-        result = parse_section_event(section, start_dt, end_dt)
+        result = parse_section_event(section, SECTION_START, SECTION_END)
         
         # Assert
         assert result == expected
     
-    def test_parse_section_event_no_presenters(self, chicago_tz):
-        """Test parsing section without presenters."""
+    @patch('main.fetch_talk_description')
+    def test_parse_section_event_uses_prefetched_description(self, mock_fetch):
+        """Test a prefetched talk description is used without fetching the talk page."""
         # Arrange
-        html = """
-        <section>
-            <h4>Event Without Presenters</h4>
-            <p class="text-sm">Room 101</p>
-        </section>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        section = soup.find("section")
-        start_dt = datetime(2025, 9, 8, 9, 0, tzinfo=chicago_tz)
-        end_dt = datetime(2025, 9, 8, 10, 0, tzinfo=chicago_tz)
-        expected = {
-            "title": "Event Without Presenters",
-            "room": "Room 101",
-            "start": start_dt,
-            "end": end_dt,
-            "description": "Location: Room 101",
-            "url": "",
-            "talk_description": "",
-        }
+        section = first_tag(FULL_SECTION_HTML, "section")
+        talk_descriptions = {"https://2025.djangocon.us/talks/opening-keynote/": "Prefetched."}
         
         # Act
-        result = parse_section_event(section, start_dt, end_dt)
+        result = parse_section_event(section, SECTION_START, SECTION_END, talk_descriptions)
         
         # Assert
-        assert result == expected
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
+        assert result.talk_description == "Prefetched."
+        mock_fetch.assert_not_called()